@@ -1,6 +1,6 @@
 """Entry point for OpenShift AI Manager CLI."""
 
-from src.openshift_ai_manager.cli import app
+from src.openshift_ai_manager.cli import main
 
 if __name__ == "__main__":
-    app()
+    main()
\ No newline at end of file
@@ -1,6 +1,25 @@
 """Core functionality for OpenShift AI Manager."""
 
-from .cluster_manager import ClusterManager
-from .addon_manager import AddonManager
+import importlib
 
-__all__ = ["ClusterManager", "AddonManager"]
\ No newline at end of file
+# Managers are imported on first attribute access so that importing the
+# package (e.g. from the CLI) does not pull in every submodule up front.
+_MANAGER_MODULES = {
+    "ClusterManager": "cluster_manager",
+    "AddonManager": "addon_manager",
+}
+
+__all__ = ["ClusterManager", "AddonManager"]
+
+
+def __getattr__(name: str):
+    if name in _MANAGER_MODULES:
+        module = importlib.import_module(f".{_MANAGER_MODULES[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,57 @@
+"""File-based cache of recent OCM logins shared across CLI invocations."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from ..models import OCMConfig
+
+CACHE_FILE = Path.home() / ".cache" / "oai-manager" / "login.json"
+
+# OCM sessions stay valid for about 8 hours after 'ocm login'
+LOGIN_TTL = 8 * 60 * 60
+
+
+def ocm_config_file(ocm_config: OCMConfig) -> Path:
+    """Path of the per-platform config file that 'ocm login' writes."""
+    return Path(f"ocm.json.{ocm_config.platform}")
+
+
+def ocm_env(ocm_config: OCMConfig) -> dict[str, str]:
+    """Environment for ocm/oc subprocesses, pointing ocm at this config's login."""
+    return {**os.environ, "OCM_CONFIG": str(ocm_config_file(ocm_config))}
+
+
+def _config_hash(ocm_config: OCMConfig) -> str:
+    """Hash the OCM config so a changed token or platform invalidates the cache."""
+    return hashlib.sha256(ocm_config.model_dump_json().encode()).hexdigest()
+
+
+def is_login_fresh(ocm_config: OCMConfig) -> bool:
+    """Check whether a login with this config was recorded and is still usable.
+
+    The login must not have expired and the OCM config file it wrote must
+    still exist and be younger than ``LOGIN_TTL``.
+    """
+    try:
+        data = json.loads(CACHE_FILE.read_text())
+        config_age = time.time() - ocm_config_file(ocm_config).stat().st_mtime
+    except (OSError, ValueError):
+        return False
+
+    return (
+        data.get("config_hash") == _config_hash(ocm_config)
+        and data.get("expires_at", 0) > time.time()
+        and config_age < LOGIN_TTL
+    )
+
+
+def record_login(ocm_config: OCMConfig, ttl: int = LOGIN_TTL) -> None:
+    """Record a successful login with this config for the next ``ttl`` seconds."""
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CACHE_FILE.write_text(json.dumps({
+        "config_hash": _config_hash(ocm_config),
+        "expires_at": time.time() + ttl,
+    }))
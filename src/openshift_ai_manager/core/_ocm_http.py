@@ -0,0 +1,65 @@
+"""Keep-alive HTTP access to the OCM REST API, used in place of the ocm CLI."""
+
+import importlib.util
+import subprocess
+from typing import TYPE_CHECKING, Optional
+
+from ..models import OCMConfig
+
+if TYPE_CHECKING:
+    import requests
+
+API_URLS = {
+    "prod": "https://api.openshift.com",
+    "stage": "https://api.stage.openshift.com",
+}
+
+
+class OCMSession:
+    """A pooled requests session authenticated with an OCM access token."""
+
+    def __init__(self, ocm_config: OCMConfig, timeout: int = 30, env: Optional[dict[str, str]] = None):
+        # requests is slow to import, so it is only loaded once a session is opened
+        import requests
+        
+        self.base_url = API_URLS[ocm_config.platform]
+        self.timeout = timeout
+        self._env = env
+        self._session = requests.Session()
+        self._refresh_token()
+
+    def _refresh_token(self) -> None:
+        """Fetch a fresh access token from the logged-in ocm CLI."""
+        result = subprocess.run(["ocm", "token"], capture_output=True, check=True, env=self._env)
+        self._session.headers["Authorization"] = f"Bearer {result.stdout.decode().strip()}"
+
+    def request(self, method: str, path: str, **kwargs) -> "requests.Response":
+        """Send a request, refreshing the access token once if it has expired."""
+        kwargs.setdefault("timeout", self.timeout)
+        url = f"{self.base_url}{path}"
+
+        response = self._session.request(method, url, **kwargs)
+        if response.status_code == 401:
+            self._refresh_token()
+            response = self._session.request(method, url, **kwargs)
+
+        return response
+
+    def get(self, path: str, **kwargs) -> "requests.Response":
+        """Send a GET request to the OCM API."""
+        return self.request("GET", path, **kwargs)
+
+
+def open_session(ocm_config: OCMConfig, env: Optional[dict[str, str]] = None) -> Optional[OCMSession]:
+    """Open an OCM API session, or return None to fall back to the ocm CLI.
+
+    ``env`` is the environment 'ocm token' runs with, so the token comes from
+    the same login as the caller's other ocm calls.
+    """
+    if not ocm_config.use_api_session or importlib.util.find_spec("requests") is None:
+        return None
+
+    try:
+        return OCMSession(ocm_config, env=env)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
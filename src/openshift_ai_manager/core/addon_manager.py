@@ -3,11 +3,33 @@
 import json
 import subprocess
 import time
-import tempfile
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
 from ..models import RHODSConfig, GPUAddonConfig, MachinePoolConfig, OCMConfig
+from ._ocm_http import OCMSession, open_session
+
+# PyYAML is only needed for operator subscriptions; import it once on demand
+_yaml = None
+
+
+def _get_yaml():
+    """Import PyYAML on first use and reuse the module afterwards."""
+    global _yaml
+    if _yaml is None:
+        import yaml
+        _yaml = yaml
+    return _yaml
+
+
+def _operator_label(operator_name: str) -> str:
+    """Label OLM puts on the CSV of an operator installed in openshift-operators."""
+    return f"operators.coreos.com/{operator_name}.openshift-operators"
 
 
 class AddonManager:
@@ -15,6 +37,14 @@ class AddonManager:
     
     def __init__(self, ocm_config: OCMConfig):
         self.ocm_config = ocm_config
+        # AddonManager never logs in itself, so ocm runs against the user's own
+        # login (the inherited environment) rather than a per-platform profile
+        self._env: Optional[dict[str, str]] = None
+        self._cluster_id_cache: dict[str, str] = {}
+        self._api: Optional[OCMSession] = None
+        self._api_opened = False
+        self._csv_api = None
+        self._csv_api_opened = False
     
     def install_rhods(self, cluster_name: str, config: RHODSConfig) -> None:
         """Install RHODS/RHOAI addon on the cluster."""
@@ -47,12 +77,9 @@ class AddonManager:
         
         self._install_addon(cluster_id, addon_spec)
         self._wait_for_addon_ready(cluster_id, config.addon_name)
+        self._verify_addon_services_ready("redhat-ods-applications")
         
         print("RHODS installation completed")
-        
-        # Additional wait for services to stabilize
-        print("Waiting additional 5 minutes for services to stabilize...")
-        time.sleep(300)
     
     def install_gpu_addon(self, cluster_name: str, config: GPUAddonConfig) -> None:
         """Install GPU addon on the cluster."""
@@ -72,12 +99,9 @@ class AddonManager:
         
         self._install_addon(cluster_id, addon_spec)
         self._wait_for_addon_ready(cluster_id, config.addon_name)
+        self._verify_addon_services_ready("redhat-nvidia-gpu-addon")
         
         print("GPU addon installation completed")
-        
-        # Additional wait for services to stabilize
-        print("Waiting additional 5 minutes for services to stabilize...")
-        time.sleep(300)
     
     def add_machine_pool(self, cluster_name: str, config: MachinePoolConfig) -> None:
         """Add a machine pool to the cluster (typically for GPU nodes)."""
@@ -99,7 +123,7 @@ class AddonManager:
             config.name
         ]
         
-        subprocess.run(cmd, check=True)
+        subprocess.run(cmd, check=True, env=self._env)
         print(f"Machine pool '{config.name}' added successfully")
         
         # Wait for machine pool to be ready
@@ -116,7 +140,7 @@ class AddonManager:
             "delete", f"/api/clusters_mgmt/v1/clusters/{cluster_id}/addons/{addon_name}"
         ]
         
-        subprocess.run(cmd, check=True)
+        subprocess.run(cmd, check=True, env=self._env)
         self._wait_for_addon_uninstalled(cluster_id, addon_name)
         
         print(f"Addon '{addon_name}' uninstalled successfully")
@@ -124,37 +148,12 @@ class AddonManager:
     def get_addon_state(self, cluster_name: str, addon_name: str) -> str:
         """Get the state of an addon."""
         cluster_id = self._get_cluster_id(cluster_name)
-        
-        cmd = [
-            "ocm", "list", "addons",
-            "--cluster", cluster_id,
-            "--columns", "id,state"
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        
-        for line in result.stdout.split('\n'):
-            if addon_name in line:
-                parts = line.strip().split()
-                if len(parts) >= 2:
-                    return parts[1]
-        
-        return "not installed"
+        return self._get_addon_state_by_id(cluster_id, addon_name)
     
     def list_addons(self, cluster_name: str) -> list[dict]:
         """List all addons installed on the cluster."""
         cluster_id = self._get_cluster_id(cluster_name)
-        
-        cmd = [
-            "ocm", "list", "addons",
-            "--cluster", cluster_id,
-            "--output", "json"
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        addons_data = json.loads(result.stdout)
-        
-        return addons_data.get("items", [])
+        return self._poll_addons(cluster_id)
     
     def _install_dependency_operators(self) -> None:
         """Install dependency operators required for RHOAI."""
@@ -166,10 +165,17 @@ class AddonManager:
             ("serverless-operator", "stable", "redhat-operators")
         ]
         
-        for operator_name, channel, source in dependencies:
-            print(f"Installing {operator_name}...")
-            self._install_operator(operator_name, channel, source)
-            self._wait_for_operator_ready(operator_name)
+        # OLM resolves each subscription independently, so submit them all
+        # up front and wait for the whole set in a single polling loop.
+        with ThreadPoolExecutor(max_workers=len(dependencies)) as executor:
+            futures = []
+            for operator_name, channel, source in dependencies:
+                print(f"Installing {operator_name}...")
+                futures.append(executor.submit(self._install_operator, operator_name, channel, source))
+            for future in futures:
+                future.result()
+        
+        self._wait_for_operators_ready([operator_name for operator_name, _, _ in dependencies])
     
     def _install_operator(self, operator_name: str, channel: str, source: str) -> None:
         """Install an operator via OLM."""
@@ -188,71 +194,173 @@ class AddonManager:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            import yaml
-            yaml.dump(subscription_spec, f)
-            temp_file = f.name
+        yaml = _get_yaml()
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        manifest = yaml.dump(subscription_spec, Dumper=dumper).encode()
         
-        try:
-            subprocess.run(["oc", "apply", "-f", temp_file], check=True)
-        finally:
-            Path(temp_file).unlink(missing_ok=True)
+        subprocess.run(["oc", "apply", "-f", "-"], input=manifest, check=True, env=self._env)
     
-    def _wait_for_operator_ready(self, operator_name: str, timeout: int = 300) -> None:
-        """Wait for an operator to be ready."""
-        print(f"Waiting for {operator_name} to be ready...")
+    def _wait_for_operators_ready(self, operator_names: list[str], timeout: int = 300) -> None:
+        """Wait for a set of operators to be ready."""
+        print(f"Waiting for {', '.join(operator_names)} to be ready...")
+        
+        pending = list(operator_names)
+        if not self._watch_operators_ready(pending, timeout):
+            self._poll_operators_ready(pending, timeout)
+        
+        for operator_name in pending:
+            print(f"Warning: {operator_name} may not be fully ready")
+    
+    def _get_csv_api(self):
+        """Load the kubeconfig on first use; None means use the oc CLI."""
+        if not self._csv_api_opened:
+            self._csv_api_opened = True
+            # The kubernetes client is optional and slow to import
+            try:
+                from kubernetes import client, config
+            except ImportError:
+                return None
+            
+            try:
+                config.load_kube_config()
+                self._csv_api = client.CustomObjectsApi()
+            except config.ConfigException:
+                pass
+        return self._csv_api
+    
+    def _watch_operators_ready(self, pending: list[str], timeout: int) -> bool:
+        """Watch CSV events until every pending operator has Succeeded.
+        
+        Ready operators are removed from ``pending``. Returns False if the
+        watch API is unavailable or the stream broke, so the caller can poll.
+        """
+        api = self._get_csv_api()
+        if api is None:
+            return False
         
-        count = 0
-        while count <= timeout:
+        import urllib3
+        from kubernetes import client, watch
+        
+        # With a single operator, let the API server filter by its OLM label
+        selector = {}
+        if len(pending) == 1:
+            selector["label_selector"] = _operator_label(pending[0])
+        
+        w = watch.Watch()
+        try:
+            for event in w.stream(
+                api.list_namespaced_custom_object,
+                group="operators.coreos.com",
+                version="v1alpha1",
+                namespace="openshift-operators",
+                plural="clusterserviceversions",
+                timeout_seconds=timeout,
+                **selector,
+            ):
+                self._mark_ready_operators(pending, [event["object"]])
+                if not pending:
+                    w.stop()
+                    break
+        except (client.ApiException, urllib3.exceptions.HTTPError):
+            return False
+        
+        return True
+    
+    def _poll_operators_ready(self, pending: list[str], timeout: int) -> None:
+        """Poll all CSVs via oc until every pending operator has Succeeded."""
+        elapsed = 0
+        delay = 5
+        while elapsed <= timeout:
             cmd = [
                 "oc", "get", "csv", "-n", "openshift-operators",
                 "-o", "json"
             ]
+            # Once a single operator is left, only fetch its CSV
+            if len(pending) == 1:
+                cmd += ["-l", _operator_label(pending[0])]
+            
+            try:
+                result = subprocess.run(cmd, capture_output=True, check=True, env=self._env)
+                self._mark_ready_operators(pending, _json.loads(result.stdout).get("items", []))
+                
+                if not pending:
+                    return
+            except subprocess.CalledProcessError:
+                pass
+            
+            time.sleep(delay)
+            elapsed += delay
+            delay = min(delay * 2, 60)
+    
+    @staticmethod
+    def _mark_ready_operators(pending: list[str], csvs: list[dict]) -> None:
+        """Remove operators whose CSV has reached the Succeeded phase."""
+        wanted = {_operator_label(operator_name): operator_name for operator_name in pending}
+        phases = {}
+        for csv in csvs:
+            labels = csv.get("metadata", {}).get("labels") or {}
+            for label in labels:
+                if label in wanted:
+                    phases[wanted[label]] = csv.get("status", {}).get("phase", "")
+        
+        for operator_name in list(pending):
+            if phases.get(operator_name) == "Succeeded":
+                print(f"{operator_name} is ready")
+                pending.remove(operator_name)
+    
+    def _verify_addon_services_ready(self, namespace: str, timeout: int = 300) -> None:
+        """Wait until every pod in the addon namespace reports Ready."""
+        print(f"Waiting for services in {namespace} to stabilize...")
+        
+        elapsed = 0
+        delay = 5
+        while elapsed <= timeout:
+            cmd = ["oc", "get", "pods", "-n", namespace, "-o", "json"]
             
             try:
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-                csvs = json.loads(result.stdout)
+                result = subprocess.run(cmd, capture_output=True, check=True, env=self._env)
+                pods = _json.loads(result.stdout).get("items", [])
                 
-                for csv in csvs.get("items", []):
-                    name = csv.get("metadata", {}).get("name", "")
-                    if operator_name in name.lower():
-                        phase = csv.get("status", {}).get("phase", "")
-                        if phase == "Succeeded":
-                            print(f"{operator_name} is ready")
-                            return
-                        break
+                if pods and all(self._pod_is_ready(pod) for pod in pods):
+                    print(f"Services in {namespace} are ready")
+                    return
             except subprocess.CalledProcessError:
                 pass
             
-            time.sleep(10)
-            count += 10
+            time.sleep(delay)
+            elapsed += delay
+            delay = min(delay * 2, 60)
         
-        print(f"Warning: {operator_name} may not be fully ready")
+        print(f"Warning: services in {namespace} may not be fully ready")
+    
+    @staticmethod
+    def _pod_is_ready(pod: dict) -> bool:
+        """Check whether a pod is Ready or has run to completion."""
+        status = pod.get("status", {})
+        if status.get("phase") == "Succeeded":
+            return True
+        return any(
+            condition.get("type") == "Ready" and condition.get("status") == "True"
+            for condition in status.get("conditions", [])
+        )
     
     def _install_addon(self, cluster_id: str, addon_spec: dict) -> None:
         """Install an addon using OCM API."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(addon_spec, f, indent=2)
-            temp_file = f.name
+        # Without --body, 'ocm post' reads the request body from stdin
+        cmd = [
+            "ocm", f"--v={self.ocm_config.verbose_level}",
+            "post", f"/api/clusters_mgmt/v1/clusters/{cluster_id}/addons"
+        ]
         
-        try:
-            cmd = [
-                "ocm", f"--v={self.ocm_config.verbose_level}",
-                "post", f"/api/clusters_mgmt/v1/clusters/{cluster_id}/addons",
-                f"--body={temp_file}"
-            ]
-            
-            subprocess.run(cmd, check=True)
-            
-        finally:
-            Path(temp_file).unlink(missing_ok=True)
+        subprocess.run(cmd, input=json.dumps(addon_spec).encode(), check=True, env=self._env)
     
     def _wait_for_addon_ready(self, cluster_id: str, addon_name: str, timeout: int = 3600) -> None:
         """Wait for addon to be in ready state."""
         print(f"Waiting for addon '{addon_name}' to be ready...")
         
-        count = 0
-        while count <= timeout:
+        elapsed = 0
+        delay = 5
+        while elapsed <= timeout:
             state = self._get_addon_state_by_id(cluster_id, addon_name)
             
             if state == "ready":
@@ -262,8 +370,9 @@ class AddonManager:
                 raise RuntimeError(f"Addon '{addon_name}' installation failed")
             
             print(f"Addon state: {state}. Waiting...")
-            time.sleep(60)
-            count += 60
+            time.sleep(delay)
+            elapsed += delay
+            delay = min(delay * 2, 60)
         
         raise TimeoutError(f"Addon '{addon_name}' not ready after {timeout/60} minutes")
     
@@ -271,8 +380,9 @@ class AddonManager:
         """Wait for addon to be uninstalled."""
         print(f"Waiting for addon '{addon_name}' to be uninstalled...")
         
-        count = 0
-        while count <= timeout:
+        elapsed = 0
+        delay = 5
+        while elapsed <= timeout:
             state = self._get_addon_state_by_id(cluster_id, addon_name)
             
             if state == "not installed":
@@ -280,51 +390,91 @@ class AddonManager:
                 return
             
             print(f"Addon state: {state}. Waiting...")
-            time.sleep(60)
-            count += 60
+            time.sleep(delay)
+            elapsed += delay
+            delay = min(delay * 2, 60)
         
         raise TimeoutError(f"Addon '{addon_name}' not uninstalled after {timeout/60} minutes")
     
     def _get_addon_state_by_id(self, cluster_id: str, addon_name: str) -> str:
         """Get addon state by cluster ID."""
+        state = self._addon_state_http(cluster_id, addon_name)
+        if state is not None:
+            return state
+        
+        for addon in self._poll_addons(cluster_id):
+            if addon.get("id") == addon_name:
+                return addon.get("state", "unknown")
+        
+        return "not installed"
+    
+    def _get_api(self) -> Optional[OCMSession]:
+        """Open the OCM API session on first use; None means use the ocm CLI."""
+        if not self._api_opened:
+            self._api = open_session(self.ocm_config)
+            self._api_opened = True
+        return self._api
+    
+    def _addon_state_http(self, cluster_id: str, addon_name: str) -> Optional[str]:
+        """Get addon state over the pooled API session, or None if unavailable."""
+        api = self._get_api()
+        if api is None:
+            return None
+        
+        # requests exceptions derive from IOError, a failed token refresh raises
+        # CalledProcessError and a malformed body ValueError
+        try:
+            response = api.get(f"/api/clusters_mgmt/v1/clusters/{cluster_id}/addons/{addon_name}")
+            if response.status_code == 404:
+                return "not installed"
+            if not response.ok:
+                return None
+            
+            return response.json().get("state", "unknown")
+        except (OSError, subprocess.CalledProcessError, ValueError):
+            return None
+    
+    def _poll_addons(self, cluster_id: str) -> list[dict]:
+        """Fetch every addon installed on the cluster with a single OCM call."""
         cmd = [
             "ocm", "list", "addons",
             "--cluster", cluster_id,
-            "--columns", "id,state"
+            "--output", "json"
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        
-        for line in result.stdout.split('\n'):
-            if addon_name in line:
-                parts = line.strip().split()
-                if len(parts) >= 2:
-                    return parts[1]
+        result = subprocess.run(cmd, capture_output=True, check=True, env=self._env)
+        addons_data = _json.loads(result.stdout)
         
-        return "not installed"
+        return addons_data.get("items", [])
     
     def _machine_pool_exists(self, cluster_id: str, pool_name: str) -> bool:
         """Check if a machine pool exists."""
         cmd = [
-            "ocm", "list", "machinepools",
-            "--cluster", cluster_id
+            "ocm", "get",
+            f"/api/clusters_mgmt/v1/clusters/{cluster_id}/machine_pools"
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        return pool_name in result.stdout
+        result = subprocess.run(cmd, capture_output=True, check=True, env=self._env)
+        pools = _json.loads(result.stdout).get("items", [])
+        
+        return any(pool.get("id") == pool_name for pool in pools)
     
     def _get_cluster_id(self, cluster_name: str) -> str:
         """Get cluster ID by name."""
+        if cluster_name in self._cluster_id_cache:
+            return self._cluster_id_cache[cluster_name]
+        
         cmd = [
             "ocm", "list", "clusters", 
             f"-p", f"search=\"name = '{cluster_name}' or id = '{cluster_name}' or external_id = '{cluster_name}'\"",
             "--columns", "id", "--no-headers"
         ]
         
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        cluster_id = result.stdout.strip()
+        result = subprocess.run(cmd, capture_output=True, check=True, env=self._env)
+        cluster_id = result.stdout.strip().decode()
         
         if not cluster_id:
             raise ValueError(f"Cluster not found: {cluster_name}")
         
+        self._cluster_id_cache[cluster_name] = cluster_id
         return cluster_id
\ No newline at end of file
@@ -1,13 +1,224 @@
 """Cluster management functionality."""
 
+# asyncio is imported inside the async methods: it is slow to import and most
+# callers (including every CLI command) only use the blocking API.
+import io
+import itertools
 import json
+import random
+import shutil
 import subprocess
-import time
 import tempfile
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import IO, Any, Awaitable, Callable, Iterable, Iterator, Optional
+
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 from ..models import ClusterConfig, OCMConfig
+from ..utils import ttl_cached
+from ._login_cache import is_login_fresh, ocm_env, record_login
+from ._ocm_http import OCMSession, open_session
+
+CLUSTERS_PATH = "/api/clusters_mgmt/v1/clusters"
+
+# Transient OCM failures are answered from the last known state for a while
+MAX_CONSECUTIVE_ERRORS = 5
+STALE_STATE_MAX_AGE = 300
+
+# requests errors derive from OSError and JSON decode errors from ValueError
+_TRANSIENT_ERRORS = (subprocess.CalledProcessError, OSError, ValueError)
+
+# get_cluster_info keys and the dotted paths they are read from
+CLUSTER_INFO_FIELDS = {
+    "name": "name",
+    "id": "id",
+    "state": "state",
+    "version": "version.raw_id",
+    "console_url": "console.url",
+    "api_url": "api.url",
+}
+
+# Below this size a full orjson parse is cheaper than streaming with ijson
+STREAM_PARSE_MIN_BYTES = 16 * 1024
+
+# ijson event names for values that are not objects or arrays
+_SCALAR_EVENTS = {"null", "boolean", "number", "string"}
+
+
+class ClusterNotFoundError(LookupError):
+    """No cluster matches the given name or ID."""
+
+
+@dataclass
+class PollSchedule:
+    """Seconds to sleep between polls; the last delay repeats once the list runs out."""
+    delays: list[float]
+    jitter: float = 0.2
+    
+    def intervals(self) -> Iterator[float]:
+        """Yield jittered sleep intervals indefinitely."""
+        for delay in itertools.chain(self.delays, itertools.repeat(self.delays[-1])):
+            yield delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+# Most clusters become ready 3-6 minutes after creation, so the first sleep
+# is long and polling tightens around the expected ready time.
+READY_POLL_SCHEDULE = PollSchedule([180, 60, 30, 20, 15])
+DELETE_POLL_SCHEDULE = PollSchedule([300, 120, 60, 30])
+
+# A cluster is never ready this soon after creation, so the first probe waits
+CREATE_INITIAL_DELAY = 40
+
+# Async sleeps wake this often to check for cancel()
+CANCEL_CHECK_INTERVAL = 1
+
+
+def _poll_on_schedule(
+    predicate: Callable[[], bool],
+    timeout: float,
+    schedule: PollSchedule,
+    sleep: Callable[[float], None] = time.sleep,
+) -> bool:
+    """Call ``predicate`` until it returns True, sleeping per ``schedule`` between calls.
+    
+    Returns False if ``timeout`` seconds pass first.
+    """
+    deadline = time.monotonic() + timeout
+    intervals = schedule.intervals()
+    while True:
+        if predicate():
+            return True
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        
+        sleep(min(next(intervals), remaining))
+
+
+async def _poll_on_schedule_async(
+    predicate: Callable[[], Awaitable[bool]],
+    timeout: float,
+    schedule: PollSchedule,
+    sleep: Callable[[float], Awaitable[None]],
+) -> bool:
+    """Async counterpart of ``_poll_on_schedule`` that sleeps without blocking the loop."""
+    deadline = time.monotonic() + timeout
+    intervals = schedule.intervals()
+    while True:
+        if await predicate():
+            return True
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        
+        await sleep(min(next(intervals), remaining))
+
+
+def _extract_fields(payload: bytes, paths: Iterable[str]) -> dict[str, Any]:
+    """Read the scalar values at dotted ``paths`` from a JSON object; missing paths map to None.
+    
+    Large payloads are stream-parsed with ijson when it is installed, stopping
+    as soon as every path has been seen instead of building the whole document.
+    """
+    found = dict.fromkeys(paths)
+    
+    if ijson is None or len(payload) < STREAM_PARSE_MIN_BYTES:
+        data = _json.loads(payload)
+        for path in found:
+            value = data
+            for key in path.split("."):
+                value = value.get(key) if isinstance(value, dict) else None
+            # Match the streaming parse, which only reports scalar values
+            found[path] = None if isinstance(value, (dict, list)) else value
+        return found
+    
+    return _scan_fields(io.BytesIO(payload), found)
+
+
+def _scan_fields(stream: IO[bytes], paths: Iterable[str]) -> dict[str, Any]:
+    """Stream-parse a JSON object with ijson, stopping once every path has been read."""
+    found = dict.fromkeys(paths)
+    remaining = set(found)
+    try:
+        for prefix, event, value in ijson.parse(stream):
+            if prefix in remaining and event in _SCALAR_EVENTS:
+                found[prefix] = value
+                remaining.discard(prefix)
+                if not remaining:
+                    break
+    except ijson.JSONError as e:
+        raise ValueError(f"Invalid JSON from OCM: {e}") from e
+    
+    return found
+
+
+def _common_spec(config: ClusterConfig) -> dict:
+    """Cluster specification fields shared by every cloud provider."""
+    version = {"channel_group": config.version.channel_group}
+    if config.version.id:
+        version["id"] = f"openshift-v{config.version.id}"
+    
+    return {
+        "name": config.name,
+        "cloud_provider": {"id": config.cloud_provider},
+        "version": version,
+        "fips": config.fips,
+        "region": {"id": config.region.id},
+        "multi_az": config.multi_az,
+        "product": {"id": "osd"},
+        "ccs": {"enabled": True},
+        "nodes": {
+            "compute": config.nodes.compute,
+            "compute_machine_type": {"id": config.nodes.compute_machine_type}
+        }
+    }
+
+
+def _aws_spec(config: ClusterConfig) -> dict:
+    """Cluster specification for AWS."""
+    spec = _common_spec(config)
+    credentials = config.aws_credentials
+    if credentials:
+        spec["aws"] = {
+            "access_key_id": credentials.access_key_id,
+            "secret_access_key": credentials.secret_access_key,
+            "account_id": credentials.account_id,
+            "tags": {"team": config.team}
+        }
+    return spec
+
+
+def _gcp_spec(config: ClusterConfig) -> dict:
+    """Cluster specification for GCP."""
+    spec = _common_spec(config)
+    credentials = config.gcp_credentials
+    if credentials:
+        spec["gcp"] = {
+            "project_id": credentials.project_id,
+            "private_key_id": credentials.private_key_id,
+            "private_key": credentials.private_key,
+            "client_id": credentials.client_id,
+            "client_email": credentials.client_email,
+            "client_x509_cert_url": credentials.client_x509_cert_url,
+            "type": credentials.auth_type,
+            "auth_uri": credentials.auth_uri,
+            "token_uri": credentials.token_uri,
+            "auth_provider_x509_cert_url": credentials.auth_provider_x509_cert_url
+        }
+    return spec
 
 
 class ClusterManager:
@@ -15,36 +226,51 @@ class ClusterManager:
     
     def __init__(self, ocm_config: OCMConfig):
         self.ocm_config = ocm_config
+        # Built once and passed to every ocm call so they all use this config's login
+        self._env = ocm_env(ocm_config)
         self.cluster_id: Optional[str] = None
+        self._cluster_ids: dict[str, str] = {}
+        self._http: Optional[OCMSession] = None
+        self._last_states: dict[str, tuple[str, float]] = {}
+        self._consecutive_errors: dict[str, int] = {}
+        self._stop_event = threading.Event()
+        self._spec_builders: dict[str, Callable[[ClusterConfig], dict]] = {
+            "aws": _aws_spec,
+            "gcp": _gcp_spec,
+        }
     
     def install_ocm_cli(self) -> None:
         """Install OCM CLI if not already installed."""
-        try:
-            subprocess.run(["ocm", "version"], capture_output=True, check=True)
+        # A file check is enough; no need to fork 'ocm version'
+        if Path("/bin/ocm").is_file() or shutil.which("ocm"):
             print("OCM CLI already installed")
             return
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
         
         print("Installing OCM CLI...")
         subprocess.run([
             "sudo", "curl", "-Lo", "/bin/ocm", self.ocm_config.cli_binary_url
-        ], check=True)
-        subprocess.run(["sudo", "chmod", "+x", "/bin/ocm"], check=True)
+        ], check=True, env=self._env)
+        subprocess.run(["sudo", "chmod", "+x", "/bin/ocm"], check=True, env=self._env)
         print("OCM CLI installed successfully")
     
     def login(self) -> None:
-        """Login to OCM using token."""
+        """Login to OCM using token, reusing a recent login with the same config."""
+        if is_login_fresh(self.ocm_config):
+            print(f"Reusing OCM login ({self.ocm_config.platform})")
+            self._http = open_session(self.ocm_config, self._env)
+            return
+        
         cmd = ["ocm", "login", f"--token={self.ocm_config.token}"]
         
         if self.ocm_config.platform == "stage":
             cmd.append("--url=staging")
         
-        # Set OCM config environment
-        env = {"OCM_CONFIG": f"ocm.json.{self.ocm_config.platform}"}
-        
-        subprocess.run(cmd, env=env, check=True)
+        subprocess.run(cmd, check=True, env=self._env)
+        record_login(self.ocm_config)
         print(f"Logged in to OCM ({self.ocm_config.platform})")
+        
+        # Reuse one keep-alive connection for the API calls that follow
+        self._http = open_session(self.ocm_config, self._env)
     
     def create_cluster(self, config: ClusterConfig) -> str:
         """Create a new OpenShift cluster."""
@@ -53,180 +279,444 @@ class ClusterManager:
         # Generate cluster specification
         cluster_spec = self._generate_cluster_spec(config)
         
-        # Write to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(cluster_spec, f, indent=2)
-            temp_file = f.name
+        if self._http is not None:
+            response = self._http.request("POST", CLUSTERS_PATH, json=cluster_spec)
+            response.raise_for_status()
+            return self._record_created_cluster(config, response.json())
         
-        try:
-            # Create cluster via OCM API
-            cmd = [
-                "ocm", f"--v={self.ocm_config.verbose_level}",
-                "post", "/api/clusters_mgmt/v1/clusters",
-                f"--body={temp_file}"
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            
-            # Parse response to get cluster ID
-            response = json.loads(result.stdout)
-            self.cluster_id = response.get("id")
-            
-            print(f"Cluster creation initiated. ID: {self.cluster_id}")
-            return self.cluster_id
-            
-        finally:
-            Path(temp_file).unlink(missing_ok=True)
+        # Create cluster via OCM API; without --body, 'ocm post' reads stdin
+        cmd = [
+            "ocm", f"--v={self.ocm_config.verbose_level}",
+            "post", CLUSTERS_PATH
+        ]
+        
+        result = subprocess.run(cmd, input=json.dumps(cluster_spec).encode(), capture_output=True, check=True, env=self._env)
+        
+        # Parse response to get cluster ID
+        return self._record_created_cluster(config, _json.loads(result.stdout))
+    
+    def _record_created_cluster(self, config: ClusterConfig, response: dict) -> str:
+        """Remember the ID of a cluster that was just created."""
+        self.cluster_id = response.get("id")
+        self._cluster_ids[config.name] = self.cluster_id
+        
+        print(f"Cluster creation initiated. ID: {self.cluster_id}")
+        return self.cluster_id
+    
+    def create_and_wait(self, config: ClusterConfig, timeout: int = 7200) -> str:
+        """Create a cluster and wait for it to be ready, reusing the ID from creation."""
+        self._stop_event.clear()
+        cluster_id = self.create_cluster(config)
+        if not cluster_id:
+            raise RuntimeError(f"OCM did not return an ID for cluster {config.name}")
+        
+        self._wait_until_ready(config.name, timeout, cluster_id, CREATE_INITIAL_DELAY)
+        return cluster_id
     
-    def wait_for_cluster_ready(self, cluster_name: str, timeout: int = 7200) -> None:
-        """Wait for cluster to be in ready state."""
+    def wait_for_cluster_ready(
+        self,
+        cluster_name: str,
+        timeout: int = 7200,
+        cluster_id: Optional[str] = None,
+        initial_delay: float = 0,
+    ) -> None:
+        """Wait for cluster to be in ready state.
+        
+        Pass ``cluster_id`` when it is already known to skip resolving the name,
+        and ``initial_delay`` to hold off the first probe after creating the cluster.
+        """
+        self._stop_event.clear()
+        self._wait_until_ready(cluster_name, timeout, cluster_id, initial_delay)
+    
+    def _wait_until_ready(
+        self, cluster_name: str, timeout: int, cluster_id: Optional[str], initial_delay: float
+    ) -> None:
+        """Wait for readiness without resetting a cancel() that arrived earlier."""
         print("Waiting for cluster to be ready...")
         
-        cluster_id = self._get_cluster_id(cluster_name)
-        count = 0
+        if cluster_id is None:
+            cluster_id = self._get_cluster_id(cluster_name)
         
-        while count <= timeout:
-            state = self._get_cluster_state(cluster_id)
-            
-            if state == "ready":
-                print(f"Cluster {cluster_name} is ready")
-                # Additional wait for services to stabilize
-                print("Waiting additional 5 minutes for services to stabilize...")
-                time.sleep(300)
-                return
-            elif state == "error":
-                raise RuntimeError(f"Cluster {cluster_name} is in error state")
+        schedule = self._poll_schedule(READY_POLL_SCHEDULE)
+        if initial_delay:
+            self._sleep(initial_delay * random.uniform(1, 1 + schedule.jitter))
+        
+        def is_ready() -> bool:
+            if not self._check_ready_state(cluster_name, self._get_cluster_state(cluster_id)):
+                return False
             
+            # Require a second ready sample before trusting the transition
+            self._sleep(15)
+            return self._get_cluster_state(cluster_id, allow_stale=False) == "ready"
+        
+        if not _poll_on_schedule(is_ready, timeout, schedule, self._sleep):
+            raise TimeoutError(f"Cluster {cluster_name} not ready after {timeout/60} minutes")
+        
+        print(f"Cluster {cluster_name} is ready")
+    
+    def _check_ready_state(self, cluster_name: str, state: str) -> bool:
+        """Report a polled state; True means the cluster just reported ready."""
+        if state == "error":
+            raise RuntimeError(f"Cluster {cluster_name} is in error state")
+        if state != "ready":
             print(f"Cluster state: {state}. Waiting...")
-            time.sleep(60)
-            count += 60
+            return False
         
-        raise TimeoutError(f"Cluster {cluster_name} not ready after {timeout/60} minutes")
+        print("Cluster reports ready, confirming services are stable...")
+        return True
     
     def delete_cluster(self, cluster_name: str) -> None:
         """Delete a cluster."""
+        self._stop_event.clear()
         cluster_id = self._get_cluster_id(cluster_name)
         
-        cmd = [
-            "ocm", f"--v={self.ocm_config.verbose_level}",
-            "delete", "cluster", cluster_id
-        ]
-        
-        subprocess.run(cmd, check=True)
+        if self._http is not None:
+            self._http.request("DELETE", f"{CLUSTERS_PATH}/{cluster_id}").raise_for_status()
+        else:
+            subprocess.run(self._delete_cluster_cmd(cluster_id), check=True, env=self._env)
         print(f"Cluster deletion initiated: {cluster_name}")
+        self._forget_cluster(cluster_name)
         
         # Wait for deletion to complete
         self._wait_for_cluster_deleted(cluster_name)
     
+    def _forget_cluster(self, cluster_name: str) -> None:
+        """Drop the cached ID and info of a cluster that is being deleted."""
+        self._cluster_ids.pop(cluster_name, None)
+        ClusterManager.get_cluster_info.evict(self, cluster_name)
+    
+    @ttl_cached(ttl=60)
     def get_cluster_info(self, cluster_name: str) -> dict:
         """Get cluster information."""
         cluster_id = self._get_cluster_id(cluster_name)
         
-        cmd = ["ocm", "describe", "cluster", cluster_id, "--json"]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        
-        cluster_info = json.loads(result.stdout)
-        
         # Extract useful information
-        info = {
-            "name": cluster_info.get("name"),
-            "id": cluster_info.get("id"),
-            "state": cluster_info.get("state"),
-            "version": cluster_info.get("version", {}).get("raw_id"),
-            "console_url": cluster_info.get("console", {}).get("url"),
-            "api_url": cluster_info.get("api", {}).get("url"),
-        }
-        
-        return info
+        fields = self._describe_cluster_fields(cluster_id, CLUSTER_INFO_FIELDS.values())
+        return {key: fields[path] for key, path in CLUSTER_INFO_FIELDS.items()}
     
     def _generate_cluster_spec(self, config: ClusterConfig) -> dict:
         """Generate cluster specification from config."""
-        spec = {
-            "name": config.name,
-            "cloud_provider": {"id": config.cloud_provider},
-            "version": {
-                "channel_group": config.version.channel_group,
-            },
-            "fips": config.fips,
-            "region": {"id": config.region.id},
-            "multi_az": config.multi_az,
-            "product": {"id": "osd"},
-            "ccs": {"enabled": True},
-            "nodes": {
-                "compute": config.nodes.compute,
-                "compute_machine_type": {"id": config.nodes.compute_machine_type}
-            }
-        }
-        
-        # Add version ID if specified
-        if config.version.id:
-            spec["version"]["id"] = f"openshift-v{config.version.id}"
-        
-        # Add cloud-specific credentials
-        if config.cloud_provider == "aws" and config.aws_credentials:
-            spec["aws"] = {
-                "access_key_id": config.aws_credentials.access_key_id,
-                "secret_access_key": config.aws_credentials.secret_access_key,
-                "account_id": config.aws_credentials.account_id,
-                "tags": {"team": config.team}
-            }
-        elif config.cloud_provider == "gcp" and config.gcp_credentials:
-            spec["gcp"] = {
-                "project_id": config.gcp_credentials.project_id,
-                "private_key_id": config.gcp_credentials.private_key_id,
-                "private_key": config.gcp_credentials.private_key,
-                "client_id": config.gcp_credentials.client_id,
-                "client_email": config.gcp_credentials.client_email,
-                "client_x509_cert_url": config.gcp_credentials.client_x509_cert_url,
-                "type": config.gcp_credentials.auth_type,
-                "auth_uri": config.gcp_credentials.auth_uri,
-                "token_uri": config.gcp_credentials.token_uri,
-                "auth_provider_x509_cert_url": config.gcp_credentials.auth_provider_x509_cert_url
-            }
-        
-        return spec
+        return self._spec_builders[config.cloud_provider](config)
     
     def _get_cluster_id(self, cluster_name: str) -> str:
-        """Get cluster ID by name."""
-        if self.cluster_id:
-            return self.cluster_id
+        """Get cluster ID by name, caching each resolved name."""
+        if cluster_name not in self._cluster_ids:
+            self._cluster_ids[cluster_name] = self._lookup_cluster_id(cluster_name)
+        return self._cluster_ids[cluster_name]
+    
+    def _lookup_cluster_id(self, cluster_name: str) -> str:
+        """Resolve a cluster name or ID via OCM, bypassing the cache."""
+        if self._http is not None:
+            # Only the ID is needed, so ask the API to leave out the rest of the cluster
+            params = {"search": self._cluster_search(cluster_name), "fields": "id", "size": 1}
+            response = self._http.get(CLUSTERS_PATH, params=params)
+            response.raise_for_status()
+            items = response.json().get("items", [])
+            if not items:
+                raise ClusterNotFoundError(f"Cluster not found: {cluster_name}")
+            return items[0]["id"]
         
-        cmd = [
+        result = subprocess.run(self._list_clusters_cmd(cluster_name), capture_output=True, check=True, env=self._env)
+        return self._parse_cluster_id(result.stdout, cluster_name)
+    
+    @staticmethod
+    def _cluster_search(cluster_name: str) -> str:
+        """OCM search expression matching a cluster by name, ID or external ID."""
+        return f"name = '{cluster_name}' or id = '{cluster_name}' or external_id = '{cluster_name}'"
+    
+    def _list_clusters_cmd(self, cluster_name: str) -> list[str]:
+        """ocm command that prints the ID of the matching cluster."""
+        return [
             "ocm", "list", "clusters", 
-            f"-p", f"search=\"name = '{cluster_name}' or id = '{cluster_name}' or external_id = '{cluster_name}'\"",
+            "-p", f"search=\"{self._cluster_search(cluster_name)}\"",
             "--columns", "id", "--no-headers"
         ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        cluster_id = result.stdout.strip()
+    
+    @staticmethod
+    def _parse_cluster_id(stdout: bytes, cluster_name: str) -> str:
+        """Extract the cluster ID printed by ``_list_clusters_cmd``."""
+        cluster_id = stdout.strip().decode()
         
         if not cluster_id:
-            raise ValueError(f"Cluster not found: {cluster_name}")
+            raise ClusterNotFoundError(f"Cluster not found: {cluster_name}")
         
-        self.cluster_id = cluster_id
         return cluster_id
     
-    def _get_cluster_state(self, cluster_id: str) -> str:
-        """Get cluster state."""
+    def _delete_cluster_cmd(self, cluster_id: str) -> list[str]:
+        """ocm command that deletes a cluster."""
+        return [
+            "ocm", f"--v={self.ocm_config.verbose_level}",
+            "delete", "cluster", cluster_id
+        ]
+    
+    def _get_cluster_state(self, cluster_id: str, allow_stale: bool = True) -> str:
+        """Get cluster state, falling back to the last known state on transient errors.
+        
+        With ``allow_stale=False`` a failed poll reports "unknown" instead, so a
+        confirming sample is never answered from the sample it is checking.
+        """
+        try:
+            state = _extract_fields(self._fetch_cluster_status(cluster_id), ["state"])["state"] or "unknown"
+        except _TRANSIENT_ERRORS as e:
+            return self._last_known_state(cluster_id, e) if allow_stale else self._unconfirmed_state(e)
+        
+        return self._remember_state(cluster_id, state)
+    
+    def _remember_state(self, cluster_id: str, state: str) -> str:
+        """Record a successfully polled state for later fallback."""
+        self._consecutive_errors[cluster_id] = 0
+        self._last_states[cluster_id] = (state, time.monotonic())
+        return state
+    
+    def _last_known_state(self, cluster_id: str, error: Exception) -> str:
+        """Return a recent state after a failed poll, or re-raise ``error``."""
+        errors = self._consecutive_errors.get(cluster_id, 0) + 1
+        self._consecutive_errors[cluster_id] = errors
+        
+        last = self._last_states.get(cluster_id)
+        if last is None or errors >= MAX_CONSECUTIVE_ERRORS or time.monotonic() - last[1] > STALE_STATE_MAX_AGE:
+            raise error
+        
+        print(f"Warning: could not get cluster state ({error}); using last known state '{last[0]}'")
+        return last[0]
+    
+    @staticmethod
+    def _unconfirmed_state(error: Exception) -> str:
+        """State reported when a poll that must not use a cached state fails."""
+        print(f"Warning: could not confirm cluster state ({error}); will retry")
+        return "unknown"
+    
+    def _describe_cluster_fields(self, cluster_id: str, paths: Iterable[str]) -> dict[str, Any]:
+        """Read the given dotted paths from the full cluster object."""
+        if self._http is not None:
+            response = self._http.get(f"{CLUSTERS_PATH}/{cluster_id}")
+            response.raise_for_status()
+            return _extract_fields(response.content, paths)
+        
         cmd = ["ocm", "describe", "cluster", cluster_id, "--json"]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        if ijson is None:
+            return _extract_fields(subprocess.run(cmd, capture_output=True, check=True, env=self._env).stdout, paths)
+        
+        # Parse the output while ocm is still writing it; the pipe is unbuffered
+        # so each read returns as soon as ocm has written something. stderr goes
+        # to a file so it can be reported without a second pipe to drain.
+        with tempfile.TemporaryFile() as stderr, subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=stderr, bufsize=0, env=self._env
+        ) as process:
+            def failure() -> subprocess.CalledProcessError:
+                stderr.seek(0)
+                return subprocess.CalledProcessError(process.returncode, cmd, stderr=stderr.read())
+            
+            try:
+                found = _scan_fields(process.stdout, paths)
+            except ValueError:
+                # Output cut short by a failing ocm is reported as the failure
+                if process.wait():
+                    raise failure() from None
+                raise
+            
+            if process.poll() is None:
+                # Every field has been read; the rest of the output is not needed.
+                # The exit status of the killed process is deliberately ignored.
+                process.kill()
+                process.wait()
+            elif process.returncode:
+                raise failure()
+        
+        return found
+    
+    def _fetch_cluster_status(self, cluster_id: str) -> bytes:
+        """Fetch the small status resource of a cluster as raw JSON, for state polls."""
+        if self._http is not None:
+            response = self._http.get(self._cluster_status_path(cluster_id))
+            response.raise_for_status()
+            return response.content
+        
+        cmd = ["ocm", "get", self._cluster_status_path(cluster_id)]
+        return subprocess.run(cmd, capture_output=True, check=True, env=self._env).stdout
+    
+    @staticmethod
+    def _cluster_status_path(cluster_id: str) -> str:
+        """OCM API path of a cluster's status, a fraction of the full cluster object."""
+        return f"{CLUSTERS_PATH}/{cluster_id}/status"
+    
+    def cancel(self) -> None:
+        """Abort any wait in progress; the waiting call raises InterruptedError."""
+        self._stop_event.set()
+    
+    def _sleep(self, seconds: float) -> None:
+        """Sleep between polls, waking early if the wait is cancelled."""
+        if self._stop_event.wait(seconds):
+            raise InterruptedError("Wait cancelled")
+    
+    async def _sleep_async(self, seconds: float) -> None:
+        """Async counterpart of ``_sleep``, checking for cancellation every ``CANCEL_CHECK_INTERVAL``."""
+        import asyncio
+        
+        # cancel() may come from another thread, so the threading.Event is
+        # polled in short slices rather than awaited
+        deadline = time.monotonic() + seconds
+        while not self._stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(remaining, CANCEL_CHECK_INTERVAL))
         
-        cluster_info = json.loads(result.stdout)
-        return cluster_info.get("state", "unknown")
+        raise InterruptedError("Wait cancelled")
+    
+    def _poll_schedule(self, default: PollSchedule) -> PollSchedule:
+        """Use the schedule from the OCM config if one is set."""
+        if self.ocm_config.poll_schedule:
+            return PollSchedule(self.ocm_config.poll_schedule)
+        return default
     
     def _wait_for_cluster_deleted(self, cluster_name: str, timeout: int = 5400) -> None:
         """Wait for cluster to be deleted."""
         print("Waiting for cluster deletion to complete...")
         
-        count = 0
-        while count <= timeout:
+        def is_deleted() -> bool:
             try:
-                self._get_cluster_id(cluster_name)
-                print("Cluster still exists, waiting...")
-                time.sleep(60)
-                count += 60
-            except ValueError:
-                print(f"Cluster {cluster_name} deleted successfully")
-                return
+                self._lookup_cluster_id(cluster_name)
+            except ClusterNotFoundError:
+                return True
+            
+            print("Cluster still exists, waiting...")
+            return False
+        
+        if not _poll_on_schedule(is_deleted, timeout, self._poll_schedule(DELETE_POLL_SCHEDULE), self._sleep):
+            raise TimeoutError(f"Cluster {cluster_name} not deleted after {timeout/60} minutes")
+        
+        print(f"Cluster {cluster_name} deleted successfully")
+    
+    async def wait_for_cluster_ready_async(
+        self,
+        cluster_name: str,
+        timeout: int = 7200,
+        cluster_id: Optional[str] = None,
+        initial_delay: float = 0,
+    ) -> None:
+        """Wait for cluster to be ready without blocking the event loop.
+        
+        Takes the same ``cluster_id`` and ``initial_delay`` options as
+        ``wait_for_cluster_ready``. Starting the wait clears any earlier
+        cancel(); to wait on several clusters, use ``wait_for_clusters_ready_async``
+        so a cancel() is not wiped by a wait that starts later.
+        """
+        self._stop_event.clear()
+        await self._wait_until_ready_async(cluster_name, timeout, cluster_id, initial_delay)
+    
+    async def wait_for_clusters_ready_async(self, cluster_names: list[str], timeout: int = 7200) -> None:
+        """Wait for several clusters at once; cancel() stops every one of the waits."""
+        import asyncio
+        
+        # Cleared once before the fan-out, so a cancel() during it is kept
+        self._stop_event.clear()
+        await asyncio.gather(*[
+            self._wait_until_ready_async(name, timeout, None, 0) for name in cluster_names
+        ])
+    
+    async def _wait_until_ready_async(
+        self, cluster_name: str, timeout: int, cluster_id: Optional[str], initial_delay: float
+    ) -> None:
+        """Async counterpart of ``_wait_until_ready``."""
+        print(f"Waiting for cluster {cluster_name} to be ready...")
+        
+        if cluster_id is None:
+            cluster_id = await self._get_cluster_id_async(cluster_name)
+        
+        schedule = self._poll_schedule(READY_POLL_SCHEDULE)
+        if initial_delay:
+            await self._sleep_async(initial_delay * random.uniform(1, 1 + schedule.jitter))
+        
+        async def is_ready() -> bool:
+            if not self._check_ready_state(cluster_name, await self._get_cluster_state_async(cluster_id)):
+                return False
+            
+            await self._sleep_async(15)
+            return await self._get_cluster_state_async(cluster_id, allow_stale=False) == "ready"
+        
+        if not await _poll_on_schedule_async(is_ready, timeout, schedule, self._sleep_async):
+            raise TimeoutError(f"Cluster {cluster_name} not ready after {timeout/60} minutes")
+        
+        print(f"Cluster {cluster_name} is ready")
+    
+    async def delete_cluster_async(self, cluster_name: str, timeout: int = 5400) -> None:
+        """Delete a cluster and wait for it to disappear without blocking the event loop.
+        
+        Like ``wait_for_cluster_ready_async``, starting clears any earlier cancel(),
+        so cancel() only stops deletions that are already under way.
+        """
+        import asyncio
+        
+        self._stop_event.clear()
+        cluster_id = await self._get_cluster_id_async(cluster_name)
+        
+        if self._http is not None:
+            response = await asyncio.to_thread(self._http.request, "DELETE", f"{CLUSTERS_PATH}/{cluster_id}")
+            response.raise_for_status()
+        else:
+            await self._run_async(self._delete_cluster_cmd(cluster_id))
+        print(f"Cluster deletion initiated: {cluster_name}")
+        self._forget_cluster(cluster_name)
+        
+        async def is_deleted() -> bool:
+            try:
+                await self._lookup_cluster_id_async(cluster_name)
+            except ClusterNotFoundError:
+                return True
+            
+            print(f"Cluster {cluster_name} still exists, waiting...")
+            return False
+        
+        schedule = self._poll_schedule(DELETE_POLL_SCHEDULE)
+        if not await _poll_on_schedule_async(is_deleted, timeout, schedule, self._sleep_async):
+            raise TimeoutError(f"Cluster {cluster_name} not deleted after {timeout/60} minutes")
+        
+        print(f"Cluster {cluster_name} deleted successfully")
+    
+    async def _get_cluster_id_async(self, cluster_name: str) -> str:
+        """Async counterpart of ``_get_cluster_id``."""
+        if cluster_name not in self._cluster_ids:
+            self._cluster_ids[cluster_name] = await self._lookup_cluster_id_async(cluster_name)
+        return self._cluster_ids[cluster_name]
+    
+    async def _lookup_cluster_id_async(self, cluster_name: str) -> str:
+        """Async counterpart of ``_lookup_cluster_id``."""
+        if self._http is not None:
+            import asyncio
+            
+            return await asyncio.to_thread(self._lookup_cluster_id, cluster_name)
+        
+        stdout = await self._run_async(self._list_clusters_cmd(cluster_name))
+        return self._parse_cluster_id(stdout, cluster_name)
+    
+    async def _get_cluster_state_async(self, cluster_id: str, allow_stale: bool = True) -> str:
+        """Async counterpart of ``_get_cluster_state``."""
+        try:
+            if self._http is not None:
+                import asyncio
+                
+                payload = await asyncio.to_thread(self._fetch_cluster_status, cluster_id)
+            else:
+                payload = await self._run_async(["ocm", "get", self._cluster_status_path(cluster_id)])
+            state = _extract_fields(payload, ["state"])["state"] or "unknown"
+        except _TRANSIENT_ERRORS as e:
+            return self._last_known_state(cluster_id, e) if allow_stale else self._unconfirmed_state(e)
+        
+        return self._remember_state(cluster_id, state)
+    
+    async def _run_async(self, cmd: list[str]) -> bytes:
+        """Run a command without blocking the event loop and return its stdout."""
+        import asyncio
+        
+        # Capture stderr like the blocking calls do, so concurrent failures do not
+        # interleave on the terminal and the error carries ocm's message
+        process = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, env=self._env
+        )
+        stdout, stderr = await process.communicate()
+        
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, cmd, output=stdout, stderr=stderr)
         
-        raise TimeoutError(f"Cluster {cluster_name} not deleted after {timeout/60} minutes")
\ No newline at end of file
+        return stdout
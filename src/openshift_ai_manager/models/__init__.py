@@ -1,11 +1,20 @@
 """Pydantic models for cluster and deployment configuration."""
 
-from .cluster import ClusterConfig
-from .credentials import AWSCredentials, GCPCredentials
-from .addons import RHODSConfig, GPUAddonConfig, AddonConfig
-from .machine_pool import MachinePoolConfig
-from .identity_provider import IdentityProviderConfig
-from .ocm import OCMConfig
+import importlib
+
+# Models are imported on first attribute access so that importing one of them
+# does not load (and build the pydantic schemas of) every other submodule.
+_MODEL_MODULES = {
+    "ClusterConfig": "cluster",
+    "AWSCredentials": "credentials",
+    "GCPCredentials": "credentials",
+    "RHODSConfig": "addons",
+    "GPUAddonConfig": "addons",
+    "AddonConfig": "addons",
+    "MachinePoolConfig": "machine_pool",
+    "IdentityProviderConfig": "identity_provider",
+    "OCMConfig": "ocm",
+}
 
 __all__ = [
     "ClusterConfig",
@@ -17,4 +26,17 @@ __all__ = [
     "MachinePoolConfig",
     "IdentityProviderConfig",
     "OCMConfig",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    if name in _MODEL_MODULES:
+        module = importlib.import_module(f".{_MODEL_MODULES[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -1,31 +1,46 @@
 """Base model with common functionality."""
 
-import json
 from pathlib import Path
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import TypeVar, Type
 
 T = TypeVar('T', bound='BaseConfigModel')
 
+# Parsed configs keyed by (model class, resolved path, mtime); a rewritten
+# file gets a new mtime and is therefore parsed again.
+_CONFIG_CACHE: dict[tuple[type, str, int], 'BaseConfigModel'] = {}
+
 
 class BaseConfigModel(BaseModel):
     """Base model with JSON file loading/saving capabilities."""
     
+    # Configs are loaded once and only read afterwards (and may be shared
+    # through the file cache), so make them immutable.
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+    
     @classmethod
     def from_json_file(cls: Type[T], file_path: Path | str) -> T:
-        """Load configuration from JSON file."""
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        return cls(**data)
+        """Load configuration from JSON file.
+
+        Results are cached per process until the file's mtime changes, so
+        repeated loads return the same (immutable) instance.
+        """
+        path = Path(file_path).resolve()
+        key = (cls, str(path), path.stat().st_mtime_ns)
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None:
+            return cached
+        
+        config = cls.model_validate_json(path.read_bytes())
+        _CONFIG_CACHE[key] = config
+        return config
 
 
     @classmethod
     def from_json_data(cls: Type[T], json_data: str) -> T:
         """Load configuration from JSON file."""
-        data = json.loads(json_data)
-        return cls(**data)
+        return cls.model_validate_json(json_data)
 
     def to_json_file(self, file_path: Path | str) -> None:
         """Save configuration to JSON file."""
-        with open(file_path, 'w') as f:
-            json.dump(self.model_dump(exclude_none=True, by_alias=True), f, indent=2)
\ No newline at end of file
+        Path(file_path).write_text(self.model_dump_json(exclude_none=True, by_alias=True, indent=2))
\ No newline at end of file
@@ -1,16 +1,17 @@
 """Cloud provider credentials models."""
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+from .base import BaseConfigModel
 
 
-class AWSCredentials(BaseModel):
+class AWSCredentials(BaseConfigModel):
     """AWS credentials for cluster creation."""
     access_key_id: str = Field(alias="accessKeyId")
     secret_access_key: str = Field(alias="secretAccessKey")
     account_id: str = Field(alias="accountId")
 
 
-class GCPCredentials(BaseModel):
+class GCPCredentials(BaseConfigModel):
     """GCP credentials for cluster creation."""
     project_id: str = Field(alias="projectId")
     private_key_id: str = Field(alias="privateKeyId")
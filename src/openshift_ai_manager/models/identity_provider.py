@@ -1,10 +1,11 @@
 """Identity provider configuration models."""
 
 from typing import Optional, Literal
-from pydantic import BaseModel, Field
+from pydantic import Field
+from .base import BaseConfigModel
 
 
-class IdentityProviderConfig(BaseModel):
+class IdentityProviderConfig(BaseConfigModel):
     """Identity provider configuration."""
     type: Literal["ldap", "htpasswd"] = Field(description="Type of identity provider")
     name: str = Field(description="Identity provider name")
@@ -1,7 +1,7 @@
 """OCM configuration models."""
 
-from typing import Literal
-from pydantic import Field
+from typing import Literal, Optional
+from pydantic import Field, PositiveInt
 from .base import BaseConfigModel
 
 
@@ -21,4 +21,15 @@ class OCMConfig(BaseConfigModel):
         default=0, 
         description="OCM logging verbosity level",
         alias="verboseLevel"
+    )
+    poll_schedule: Optional[list[PositiveInt]] = Field(
+        default=None,
+        min_length=1,
+        description="Seconds to sleep between cluster state polls; the last value repeats",
+        alias="pollSchedule"
+    )
+    use_api_session: bool = Field(
+        default=True,
+        description="Call the OCM REST API over a pooled session when requests is installed",
+        alias="useApiSession"
     )
\ No newline at end of file
@@ -1,25 +1,33 @@
 """Utility functions for OpenShift AI Manager."""
 
-import json
+import copy
+import functools
+import time
 from pathlib import Path
-from typing import TypeVar, Type
+from typing import Any, Callable, Hashable, TypeVar, Type
 
 from pydantic import BaseModel
 
 T = TypeVar('T', bound=BaseModel)
 
+_MISSING = object()
+
 
 def load_config_from_json(config_class: Type[T], file_path: Path | str) -> T:
     """Load a Pydantic model from a JSON file."""
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    return config_class(**data)
+    path = Path(file_path)
+    # Opening the file doubles as the existence check, so no separate stat
+    try:
+        with path.open("rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {path}") from None
+    return config_class.model_validate_json(data)
 
 
 def save_config_to_json(config: BaseModel, file_path: Path | str) -> None:
     """Save a Pydantic model to a JSON file."""
-    with open(file_path, 'w') as f:
-        json.dump(config.model_dump(exclude_none=True, by_alias=True), f, indent=2)
+    Path(file_path).write_text(config.model_dump_json(exclude_none=True, by_alias=True, indent=2))
 
 
 def validate_file_exists(file_path: Path | str) -> Path:
@@ -27,4 +35,69 @@ def validate_file_exists(file_path: Path | str) -> Path:
     path = Path(file_path)
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {path}")
-    return path
\ No newline at end of file
+    return path
+
+
+class TTLCache:
+    """Dict-backed cache whose entries expire ``ttl`` seconds after being set."""
+    
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: dict[Hashable, tuple[Any, float]] = {}
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or ``default`` if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        
+        return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache ``value`` under ``key`` for ``ttl`` seconds."""
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+    
+    def discard(self, key: Hashable) -> None:
+        """Drop the entry for ``key`` if there is one."""
+        self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+
+def ttl_cached(ttl: float) -> Callable:
+    """Cache a method's result per instance and positional arguments for ``ttl`` seconds.
+    
+    Callers get a shallow copy so mutating a result cannot change later reads.
+    ``method.evict(instance, *args)`` drops one cached result early.
+    """
+    def decorator(method: Callable) -> Callable:
+        attr = f"_ttl_cache_{method.__name__}"
+        
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            cache = self.__dict__.get(attr)
+            if cache is None:
+                cache = self.__dict__[attr] = TTLCache(ttl)
+            
+            value = cache.get(args, _MISSING)
+            if value is _MISSING:
+                value = method(self, *args)
+                cache.set(args, value)
+            return copy.copy(value)
+        
+        def evict(self, *args) -> None:
+            cache = self.__dict__.get(attr)
+            if cache is not None:
+                cache.discard(args)
+        
+        wrapper.evict = evict
+        return wrapper
+    
+    return decorator